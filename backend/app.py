@@ -1,14 +1,26 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from .config import settings
+from .router.api import motw
 from .router.api import router as api_router
 
-app = FastAPI(docs_url=None, redoc_url=None)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the shared HTTP sessions on shutdown
+    await motw.fpl_api.aclose()
+    motw.fpl_api.close()
+
+
+app = FastAPI(docs_url=None, redoc_url=None, lifespan=lifespan)
 
 # Add CORS middleware to allow frontend connections
 app.add_middleware(
@@ -19,6 +31,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses; CSV reports are highly repetitive and shrink ~5-10x
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Include the API router
 app.include_router(api_router, prefix="/api")
 
@@ -23,6 +23,7 @@ class Settings:
     FPL_API_BASE_URL: str = os.getenv(
         "FPL_API_BASE_URL", "https://fantasy.premierleague.com/api"
     )
+    FPL_API_MAX_CONCURRENCY: int = int(os.getenv("FPL_API_MAX_CONCURRENCY", "20"))
 
     @property
     def is_production(self) -> bool:
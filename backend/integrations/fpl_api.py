@@ -1,6 +1,29 @@
-from typing import Dict
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
+import aiohttp
+import msgspec
+import orjson
 import requests
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class EntryHistory(msgspec.Struct):
+    """The slice of a manager's gameweek entry history the report consumes."""
+
+    event_transfers_cost: int
+
+
+class GameweekPicks(msgspec.Struct):
+    """
+    A manager's gameweek picks response, decoded down to the fields actually
+    used. msgspec skips every other field without allocating Python objects.
+    """
+
+    entry_history: EntryHistory
 
 
 class FantasyPremierLeagueAPI:
@@ -8,8 +31,145 @@ class FantasyPremierLeagueAPI:
     A class to interact with the Fantasy Premier League API.
     """
 
-    def __init__(self, base_url: str = "https://fantasy.premierleague.com/api"):
+    # Default maximum number of concurrent requests against the FPL API
+    MAX_CONCURRENT_REQUESTS = 20
+    # Maximum number of retries on 429/5xx responses
+    MAX_RETRIES = 3
+    # How long cached standings pages stay fresh without revalidation
+    STANDINGS_CACHE_TTL = 300
+
+    # Precompiled URL templates, formatted per call with format_map
+    _LEAGUE_STANDINGS_URL = "{base}/leagues-classic/{league_id}/standings/"
+    _MANAGER_DETAILS_URL = "{base}/entry/{manager_id}"
+    _MANAGER_PICKS_URL = "{base}/entry/{manager_id}/event/{gameweek_id}/picks"
+
+    def __init__(
+        self,
+        base_url: str = "https://fantasy.premierleague.com/api",
+        max_concurrency: Optional[int] = None,
+    ):
         self.base_url = base_url
+        self._semaphore = asyncio.Semaphore(
+            max_concurrency or self.MAX_CONCURRENT_REQUESTS
+        )
+        # Reuse keep-alive connections across requests instead of paying a
+        # TCP+TLS handshake per call
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+                respect_retry_after_header=True,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Picks never change once the gameweek deadline has passed, so they can
+        # be cached for the lifetime of the process
+        self._picks_cache = LRUCache(maxsize=10_000)
+        # Manager details carry the current gameweek, so cache them only for
+        # a short TTL
+        self._manager_cache = TTLCache(maxsize=10_000, ttl=self.STANDINGS_CACHE_TTL)
+        # Standings change a few times per gameweek; keep them fresh for a short
+        # TTL and revalidate with ETags after that. The ETag stores are bounded
+        # too, since league IDs come from arbitrary requests
+        self._standings_cache = TTLCache(maxsize=128, ttl=self.STANDINGS_CACHE_TTL)
+        self._standings_etags = LRUCache(maxsize=1024)
+        self._standings_etag_data = LRUCache(maxsize=1024)
+        # Managers repeat across requests within a gameweek, so memoize the
+        # formatted picks URL per (manager, gameweek)
+        self._manager_picks_url = lru_cache(maxsize=10_000)(self._manager_picks_url)
+        # Shared aiohttp session, created lazily on the running event loop
+        self._asession: Optional[aiohttp.ClientSession] = None
+
+    def _manager_picks_url(self, manager_id: str, gameweek_id: int) -> str:
+        """Format the picks URL for a manager and gameweek."""
+        return self._MANAGER_PICKS_URL.format_map(
+            {
+                "base": self.base_url,
+                "manager_id": manager_id,
+                "gameweek_id": gameweek_id,
+            }
+        )
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _ensure_asession(self) -> aiohttp.ClientSession:
+        """Create the shared aiohttp session on first use."""
+        if self._asession is None or self._asession.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=64)
+            self._asession = aiohttp.ClientSession(connector=connector)
+        return self._asession
+
+    async def aclose(self):
+        """Close the shared aiohttp session."""
+        if self._asession is not None and not self._asession.closed:
+            await self._asession.close()
+
+    async def _aget(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        struct_type: Optional[type] = None,
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Issue a GET request with bounded concurrency and exponential-backoff
+        retries on 429 and 5xx responses.
+
+        Returns a (data, etag) tuple; data is None on 304 Not Modified. When
+        struct_type is given, the body is decoded into that msgspec.Struct
+        instead of a plain dict.
+        """
+        session = self._ensure_asession()
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with self._semaphore:
+                async with session.get(url, params=params, headers=headers) as response:
+                    if (
+                        response.status == 429 or response.status >= 500
+                    ) and attempt < self.MAX_RETRIES:
+                        retry_after = response.headers.get("Retry-After")
+                        delay = float(retry_after) if retry_after else float(2**attempt)
+                    elif response.status == 304:
+                        return None, None
+                    else:
+                        response.raise_for_status()
+                        raw = await response.read()
+                        data = (
+                            msgspec.json.decode(raw, type=struct_type)
+                            if struct_type
+                            else orjson.loads(raw)
+                        )
+                        return data, response.headers.get("ETag")
+            await asyncio.sleep(delay)
+
+    def _standings_conditional_headers(self, cache_key: tuple) -> Optional[Dict]:
+        """
+        Build If-None-Match headers when an ETag is known for this page and the
+        body to serve on a 304 is still cached.
+        """
+        if cache_key not in self._standings_etag_data:
+            return None
+        etag = self._standings_etags.get(cache_key)
+        return {"If-None-Match": etag} if etag else None
+
+    def _store_standings(self, cache_key: tuple, etag: Optional[str], data: Dict):
+        """Store a standings page in the TTL cache and the ETag store."""
+        self._standings_cache[cache_key] = data
+        if etag:
+            self._standings_etags[cache_key] = etag
+            self._standings_etag_data[cache_key] = data
 
     def get_classic_league_standings(
         self,
@@ -28,10 +188,26 @@ class FantasyPremierLeagueAPI:
         Returns:
             Dict: League standings as returned by the FPL API.
         """
-        url = f"{self.base_url}/leagues-classic/{league_id}/standings/"
-        response = requests.get(url, params={"page_standings": page, "phase": phase})
+        cache_key = (league_id, page, phase)
+        if cache_key in self._standings_cache:
+            return self._standings_cache[cache_key]
+
+        url = self._LEAGUE_STANDINGS_URL.format_map(
+            {"base": self.base_url, "league_id": league_id}
+        )
+        response = self._session.get(
+            url,
+            params={"page_standings": page, "phase": phase},
+            headers=self._standings_conditional_headers(cache_key),
+        )
+        if response.status_code == 304:
+            data = self._standings_etag_data[cache_key]
+            self._standings_cache[cache_key] = data
+            return data
         response.raise_for_status()
-        return response.json()
+        data = orjson.loads(response.content)
+        self._store_standings(cache_key, response.headers.get("ETag"), data)
+        return data
 
     def get_manager_details(self, manager_id: str) -> Dict:
         """
@@ -43,12 +219,21 @@ class FantasyPremierLeagueAPI:
         Returns:
             Dict: Manager details as returned by the FPL API.
         """
-        url = f"{self.base_url}/entry/{manager_id}"
-        response = requests.get(url)
+        if manager_id in self._manager_cache:
+            return self._manager_cache[manager_id]
+
+        url = self._MANAGER_DETAILS_URL.format_map(
+            {"base": self.base_url, "manager_id": manager_id}
+        )
+        response = self._session.get(url)
         response.raise_for_status()
-        return response.json()
+        data = orjson.loads(response.content)
+        self._manager_cache[manager_id] = data
+        return data
 
-    def get_manager_gameweek_picks(self, manager_id: str, gameweek_id: int) -> Dict:
+    def get_manager_gameweek_picks(
+        self, manager_id: str, gameweek_id: int
+    ) -> GameweekPicks:
         """
         Get the gameweek picks for a specific manager.
 
@@ -56,9 +241,94 @@ class FantasyPremierLeagueAPI:
             manager_id (str): The ID of the manager.
             gameweek_id (int): The ID of the gameweek.
         Returns:
-            Dict: Gameweek picks as returned by the FPL API.
+            GameweekPicks: The fields of the picks response used by reports.
         """
-        url = f"{self.base_url}/entry/{manager_id}/event/{gameweek_id}/picks"
-        response = requests.get(url)
+        cache_key = (manager_id, gameweek_id)
+        if cache_key in self._picks_cache:
+            return self._picks_cache[cache_key]
+
+        url = self._manager_picks_url(manager_id, gameweek_id)
+        response = self._session.get(url)
         response.raise_for_status()
-        return response.json()
+        data = msgspec.json.decode(response.content, type=GameweekPicks)
+        self._picks_cache[cache_key] = data
+        return data
+
+    async def aget_classic_league_standings(
+        self,
+        league_id: str,
+        page: int = 1,
+        phase: int = 1,
+    ) -> Dict:
+        """
+        Get the standings of a classic league, asynchronously.
+
+        Args:
+            league_id (str): The ID of the league.
+            page (int): The page number for paginated results. Defaults to 1.
+            phase (int): The phase to filter by. Defaults to 1.
+
+        Returns:
+            Dict: League standings as returned by the FPL API.
+        """
+        cache_key = (league_id, page, phase)
+        if cache_key in self._standings_cache:
+            return self._standings_cache[cache_key]
+
+        url = self._LEAGUE_STANDINGS_URL.format_map(
+            {"base": self.base_url, "league_id": league_id}
+        )
+        data, etag = await self._aget(
+            url,
+            params={"page_standings": page, "phase": phase},
+            headers=self._standings_conditional_headers(cache_key),
+        )
+        if data is None:  # 304 Not Modified
+            data = self._standings_etag_data[cache_key]
+            self._standings_cache[cache_key] = data
+            return data
+        self._store_standings(cache_key, etag, data)
+        return data
+
+    async def aget_manager_details(self, manager_id: str) -> Dict:
+        """
+        Get details of a specific manager, asynchronously.
+
+        Args:
+            manager_id (str): The ID of the manager.
+
+        Returns:
+            Dict: Manager details as returned by the FPL API.
+        """
+        if manager_id in self._manager_cache:
+            return self._manager_cache[manager_id]
+
+        url = self._MANAGER_DETAILS_URL.format_map(
+            {"base": self.base_url, "manager_id": manager_id}
+        )
+        data, _ = await self._aget(url)
+        self._manager_cache[manager_id] = data
+        return data
+
+    async def aget_manager_gameweek_picks(
+        self,
+        manager_id: str,
+        gameweek_id: int,
+    ) -> GameweekPicks:
+        """
+        Get the gameweek picks for a specific manager, asynchronously.
+
+        Args:
+            manager_id (str): The ID of the manager.
+            gameweek_id (int): The ID of the gameweek.
+        Returns:
+            GameweekPicks: The fields of the picks response used by reports.
+        """
+        cache_key = (manager_id, gameweek_id)
+        if cache_key in self._picks_cache:
+            return self._picks_cache[cache_key]
+
+        url = self._manager_picks_url(manager_id, gameweek_id)
+        data, _ = await self._aget(url, struct_type=GameweekPicks)
+        self._picks_cache[cache_key] = data
+        return data
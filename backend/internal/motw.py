@@ -1,11 +1,27 @@
+import asyncio
 from io import BytesIO
-from typing import Tuple
+from typing import Literal, Tuple
 
+import aiohttp
 import polars as pl
-import requests
+import pyarrow as pa
+from cachetools import TTLCache
 
 from ..integrations.fpl_api import FantasyPremierLeagueAPI
 
+# Columns of the FPL standings results the report actually uses; passing the
+# schema explicitly lets Arrow pivot the row dicts straight into columnar
+# buffers without inferring types, and drops the unused columns at ingest
+STANDINGS_SCHEMA = pa.schema(
+    [
+        pa.field("entry", pa.int64()),
+        pa.field("entry_name", pa.string()),
+        pa.field("player_name", pa.string()),
+        pa.field("event_total", pa.int64()),
+        pa.field("total", pa.int64()),
+    ]
+)
+
 
 class LeagueNotFoundError(Exception):
     """Raised when a league cannot be found."""
@@ -24,115 +40,196 @@ class ManagerOfTheWeek:
     Class to handle the logic for generating the Manager of the Week report.
     """
 
+    # Number of managers whose picks are fetched concurrently per batch
+    PICKS_BATCH_SIZE = 32
+    # Number of standings pages fetched concurrently per window
+    STANDINGS_PAGE_WINDOW = 8
+    # How long built reports stay cached; kept short since the current
+    # gameweek's scores can still change while matches are live
+    REPORT_CACHE_TTL = 60
+
     def __init__(self, fpl_api: FantasyPremierLeagueAPI):
         self.fpl_api = fpl_api
+        self._report_cache = TTLCache(maxsize=256, ttl=self.REPORT_CACHE_TTL)
 
-    def generate_report(
+    async def generate_report(
         self,
         league_id: str,
         *,
         limit: int = 10,
+        output_format: Literal["csv", "feather"] = "csv",
     ) -> Tuple[str, BytesIO]:
         """
         Generate the Manager of the Week report for a given league.
+
+        Returns the report filename and an in-memory buffer with the
+        serialized report. Built reports are cached per
+        (league, gameweek, limit, format) for a short TTL, so repeated
+        requests for a popular league skip the whole pipeline.
         """
 
-        standings = self._compile_league_standings(league_id).sort(
+        standings = (await self._compile_league_standings(league_id)).sort(
             "event_total", descending=True
         )
-        current_gw = self.fpl_api.get_manager_details(standings["entry"][0])[
+        current_gw = (await self.fpl_api.aget_manager_details(standings["entry"][0]))[
             "current_event"
         ]
 
         limit = len(standings) if limit > len(standings) else limit
-        transfers_cost = []
-        n_zero_transfers = 0
-        i = 0
-        while (
-            n_zero_transfers < limit
-        ):  # Find at least `limit` managers with zero transfers
-            manager_id = standings["entry"][i]
-            picks = self.fpl_api.get_manager_gameweek_picks(manager_id, current_gw)
-            cost = picks["entry_history"]["event_transfers_cost"]
-            if cost == 0:
-                n_zero_transfers += 1
-            transfers_cost.append(cost)
-            i += 1
-
-        standings = (
-            standings.slice(0, len(transfers_cost))
-            .with_columns(pl.Series("transfers_cost", transfers_cost).cast(pl.Int64))
+        cache_key = (league_id, current_gw, limit, output_format)
+        cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            filename, data = cached
+            return filename, BytesIO(data)
+
+        transfers_cost = await self._fetch_transfers_cost(standings, current_gw, limit)
+
+        # One lazy plan from the fetched standings through to the prettified
+        # report, so Polars fuses the slice, arithmetic, filter and projection
+        report = (
+            standings.lazy()
+            .slice(0, len(transfers_cost))
+            .with_columns(pl.Series("transfers_cost", transfers_cost, dtype=pl.Int64))
             .with_columns(
                 (pl.col("event_total") - pl.col("transfers_cost")).alias(
                     "net_event_total"
                 )
             )
+            .filter(  # Include all tied at the limit
+                pl.col("net_event_total")
+                >= pl.col("net_event_total").top_k(limit).min()
+            )
             .sort(["net_event_total", "total"], descending=[True, True])
         )
-        limit_score = standings["net_event_total"][
-            limit - 1
-        ]  # Include all tied at the limit
-        standings = standings.filter(pl.col("net_event_total") >= limit_score)
 
-        filename = f"fpl-motw-league-{league_id}-gw-{current_gw}.csv"
-        buffer = BytesIO()
-        self._prettify_report(standings, current_gw).write_csv(
-            buffer, include_bom=True, separator=";"
+        filename = f"fpl-motw-league-{league_id}-gw-{current_gw}.{output_format}"
+        data = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._serialize_report,
+            self._prettify_report(report, current_gw),
+            output_format,
         )
-        buffer.seek(0)
+        self._report_cache[cache_key] = (filename, data)
+
+        return filename, BytesIO(data)
+
+    def _serialize_report(self, report: pl.LazyFrame, output_format: str) -> bytes:
+        """Serialize the report plan to bytes in the requested format."""
+        buffer = BytesIO()
+        if output_format == "feather":
+            report.sink_ipc(buffer, compression="lz4")
+        else:
+            report.sink_csv(buffer, include_bom=True, separator=";")
+        return buffer.getvalue()
+
+    async def _fetch_transfers_cost(
+        self,
+        standings: pl.DataFrame,
+        gameweek_id: int,
+        limit: int,
+    ) -> list:
+        """
+        Fetch the transfers cost for managers from the top of the standings until
+        at least `limit` managers with zero transfers are found.
 
-        return filename, buffer
+        Picks are fetched concurrently in batches, so wall time is bounded by the
+        number of batches rather than the number of managers.
+        """
 
-    def _compile_league_standings(self, league_id: str) -> pl.DataFrame:
+        entries = standings["entry"].to_list()
+        transfers_cost = []
+        n_zero_transfers = 0
+        i = 0
+        while n_zero_transfers < limit and i < len(entries):
+            batch = entries[i : i + self.PICKS_BATCH_SIZE]
+            picks = await asyncio.gather(
+                *[
+                    self.fpl_api.aget_manager_gameweek_picks(manager_id, gameweek_id)
+                    for manager_id in batch
+                ]
+            )
+            for p in picks:
+                if n_zero_transfers >= limit:
+                    break
+                cost = p.entry_history.event_transfers_cost
+                if cost == 0:
+                    n_zero_transfers += 1
+                transfers_cost.append(cost)
+            i += len(batch)
+
+        return transfers_cost
+
+    async def _compile_league_standings(self, league_id: str) -> pl.DataFrame:
         """
         Compile complete standings for a private classic league.
+
+        The first page is fetched alone to validate the league; the remaining
+        pages are fetched concurrently in windows until a page reports that no
+        next page exists.
         """
 
-        standings = []
-        page = 1
-        has_next = True
-        validated = False
+        try:
+            response = await self.fpl_api.aget_classic_league_standings(
+                league_id, page=1
+            )
 
-        while has_next:
-            try:
-                response = self.fpl_api.get_classic_league_standings(
-                    league_id, page=page
+            if response["league"]["league_type"] != "x":
+                raise InvalidLeagueError(
+                    f"League ID {league_id} is not a private classic league"
                 )
 
-                # Only validate on the first page
-                if not validated:
-                    valid = response["league"]["league_type"] == "x"
-                    if not valid:
-                        raise InvalidLeagueError(
-                            f"League ID {league_id} is not a private classic league"
+            # Pivot each page into columnar Arrow buffers as it arrives, so the
+            # row dicts can be garbage collected instead of piling up in a
+            # league-sized Python list
+            tables = [
+                pa.Table.from_pylist(
+                    response["standings"]["results"], schema=STANDINGS_SCHEMA
+                )
+            ]
+            has_next = response["standings"]["has_next"]
+            page = 2
+
+            while has_next:
+                responses = await asyncio.gather(
+                    *[
+                        self.fpl_api.aget_classic_league_standings(league_id, page=p)
+                        for p in range(page, page + self.STANDINGS_PAGE_WINDOW)
+                    ]
+                )
+                for response in responses:
+                    tables.append(
+                        pa.Table.from_pylist(
+                            response["standings"]["results"], schema=STANDINGS_SCHEMA
                         )
-                    validated = True
+                    )
+                    has_next = response["standings"]["has_next"]
+                    if not has_next:
+                        break
+                page += self.STANDINGS_PAGE_WINDOW
 
-                standings.extend(response["standings"]["results"])
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                raise LeagueNotFoundError(f"League ID {league_id} not found")
+            raise e
 
-                has_next = response["standings"]["has_next"]
-                page += 1
-
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    raise LeagueNotFoundError(f"League ID {league_id} not found")
-                raise e
-
-        return pl.DataFrame(standings)
+        return pl.from_arrow(pa.concat_tables(tables)).rechunk()
 
     def _prettify_report(
         self,
-        standings: pl.DataFrame,
+        standings: pl.LazyFrame,
         gameweek_id: int,
-    ) -> pl.DataFrame:
+    ) -> pl.LazyFrame:
         """
         Prettify column names and add the web link to each manager's gameweek points.
         """
+        # Plain Utf8 concat with the gameweek baked into the suffix; this hits
+        # the monomorphic string kernel instead of the generic pl.format path
+        suffix = f"/event/{gameweek_id}"
         standings = standings.with_columns(
-            pl.format(
-                "https://fantasy.premierleague.com/entry/{}/event/{}",
-                pl.col("entry"),
-                pl.lit(gameweek_id),
+            (
+                pl.lit("https://fantasy.premierleague.com/entry/")
+                + pl.col("entry").cast(pl.Utf8)
+                + pl.lit(suffix)
             ).alias("web_link")
         )
         headers = {
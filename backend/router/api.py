@@ -1,4 +1,5 @@
 from traceback import print_exc
+from typing import Literal
 
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
@@ -9,24 +10,38 @@ from ..internal.motw import InvalidLeagueError, LeagueNotFoundError, ManagerOfTh
 
 router = APIRouter()
 motw = ManagerOfTheWeek(
-    fpl_api=FantasyPremierLeagueAPI(base_url=settings.FPL_API_BASE_URL)
+    fpl_api=FantasyPremierLeagueAPI(
+        base_url=settings.FPL_API_BASE_URL,
+        max_concurrency=settings.FPL_API_MAX_CONCURRENCY,
+    )
 )
 
 
+# Media types per output format; CSV stays octet-stream to force download
+MEDIA_TYPES = {
+    "csv": "application/octet-stream",
+    "feather": "application/vnd.apache.arrow.file",
+}
+
+
 @router.post("/report/{league_id}")
 async def generate_report(
     league_id: str,
     limit: int = Query(10),
+    output_format: Literal["csv", "feather"] = Query("csv"),
 ):
     try:
-        filename, buffer = motw.generate_report(league_id, limit=limit)
+        filename, buffer = await motw.generate_report(
+            league_id, limit=limit, output_format=output_format
+        )
         return StreamingResponse(
             buffer,
-            media_type="application/octet-stream",  # Forces download
+            media_type=MEDIA_TYPES[output_format],
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Type": "application/octet-stream",
+                "Content-Type": MEDIA_TYPES[output_format],
                 "Access-Control-Expose-Headers": "Content-Disposition",  # Expose header for CORS
+                "Cache-Control": "public, max-age=60",
             },
         )
 